@@ -1,5 +1,3 @@
-from __future__ import annotations
-
 """Auto-start coverage in subprocesses.
 
 When `COVERAGE_PROCESS_START` is set (e.g. to `pyproject.toml`), Coverage.py can
@@ -9,14 +7,19 @@ that validate snektest via subprocesses.
 See: https://coverage.readthedocs.io/en/latest/subprocess.html
 """
 
-try:
-    import coverage
-except ModuleNotFoundError:
-    coverage = None
+from __future__ import annotations
+
+import os
 
 
 def _maybe_start_coverage() -> None:
-    if coverage is None:
+    # Check the variable first so ordinary processes skip importing coverage.
+    if not os.environ.get("COVERAGE_PROCESS_START"):
+        return
+
+    try:
+        import coverage  # noqa: PLC0415
+    except ModuleNotFoundError:
         return
 
     _ = coverage.process_startup()
@@ -76,9 +76,11 @@ def test_needs_parentheses() -> None:
 - A fixture may depend on another by calling `load_fixture()` in its body. A function fixture may depend on function or session fixtures; a session fixture may depend on session fixtures but not function fixtures (raises `FixtureError`, since it would outlive the per-test dependency). An async fixture may depend on sync or async fixtures; a sync fixture cannot await an async dependency. A depending fixture is torn down before the fixtures it loaded, so it may use them during teardown.
 - Put all `load_fixture(...)` calls at the beginning of the test, before actions or assertions.
 - Avoid conditional or mid-test fixture loading unless delayed loading is the behavior under test.
-- Tests run sequentially on a single shared event loop; avoid import-time side effects in test modules, and do not leave unawaited background tasks behind.
+- Tests run sequentially on a single shared event loop; avoid import-time side effects in test modules, and do not leave unawaited background tasks behind. Files run in directory-walk order (a directory's own files before its subdirectories) and tests within a module in definition order.
 - Console summary lines are compact and may truncate exception details; use full failure details or `--json-output` when exact diagnostics matter.
+- `--json-stream` prints one JSON line per test (`"event": "test"`) as it finishes, then a final `"event": "summary"` line with the counts; it cannot be combined with `--json-output`.
 - Filter runs with paths such as `snektest tests/test_math.py::test_addition` or markers such as `snektest --mark fast`.
+- Directory walks skip hidden directories (`.git`, `.venv`, ...) and `__pycache__`; pass such a path explicitly to run tests inside it.
 - Bound runaway tests with `snektest --timeout SECONDS`. It is async-only and best-effort: the timeout only fires while a test is suspended on an `await`, reporting a hung `await` as an error while the run continues; synchronous or CPU-bound work cannot be interrupted. There is no per-test timeout.
 - Timeout interactions: for async `@test_hypothesis`, `--timeout` bounds the whole property run (not each example) and the Hypothesis worker thread keeps running after it fires, so use Hypothesis's own `deadline`/`max_examples` instead; sync property tests are not bounded. With `--pdb`, a timed-out test post-mortems on snektest's internal timeout machinery, not the line that hung, so `--pdb` is of limited use for timeouts.
 - Explicit test-name and parameter-case filters fail if the requested test or case is not found.
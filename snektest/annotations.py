@@ -31,6 +31,8 @@ class Fixture[T]:
     `scope` is ignored and each `with` block does its own setup/teardown.
     """
 
+    __slots__ = ("_gen", "key", "make", "name", "scope")
+
     def __init__(
         self, make: Callable[[], Generator[T]], scope: Scope, key: object, name: str
     ) -> None:
@@ -64,6 +66,8 @@ class AsyncFixture[T]:
     `scope` is ignored and each block does its own setup/teardown.
     """
 
+    __slots__ = ("_agen", "key", "make", "name", "scope")
+
     def __init__(
         self,
         make: Callable[[], AsyncGenerator[T]],
@@ -1,11 +1,10 @@
 import asyncio
 import json
 import sys
-import threading
 import traceback
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
-from typing import Literal, cast
+from typing import Literal
 
 from snektest.agent_docs import (
     get_agent_docs,
@@ -27,51 +26,17 @@ from snektest.models import (
     UnreachableError,
 )
 from snektest.presenter import print_error
-from snektest.reporting import ConsoleRunReporter, NullRunReporter, RunReporter
-
-
-def _json_result_status(result: TestResult) -> str:
-    match result.result:
-        case PassedResult():
-            return "passed"
-        case FailedResult():
-            return "failed"
-        case ErrorResult():
-            return "error"
-
-
-def _json_exception(
-    exc_type: type[BaseException], exc_value: BaseException
-) -> dict[str, str]:
-    return {"type": exc_type.__name__, "message": str(exc_value)}
-
-
-def _json_test_entry(result: TestResult) -> dict[str, object]:
-    entry: dict[str, object] = {
-        "name": str(result.name),
-        "duration": result.duration,
-        "markers": list(result.markers),
-        "status": _json_result_status(result),
-    }
-    match result.result:
-        case FailedResult(exc_type=exc_type, exc_value=exc_value):
-            entry["exception"] = _json_exception(exc_type, exc_value)
-        case ErrorResult(exc_type=exc_type, exc_value=exc_value):
-            entry["exception"] = _json_exception(exc_type, exc_value)
-        case PassedResult():
-            pass
-    if result.fixture_teardown_failures:
-        entry["fixture_teardown_failures"] = [
-            {
-                "fixture_name": failure.fixture_name,
-                "exception": _json_exception(failure.exc_type, failure.exc_value),
-            }
-            for failure in result.fixture_teardown_failures
-        ]
-    return entry
+from snektest.reporting import (
+    ConsoleRunReporter,
+    JsonStreamRunReporter,
+    NullRunReporter,
+    RunReporter,
+    json_exception,
+    json_test_entry,
+)
 
 
-def build_json_summary(summary: TestRunSummary) -> dict[str, object]:
+def _json_summary_counts(summary: TestRunSummary) -> dict[str, object]:
     return {
         "passed": summary.passed,
         "failed": summary.failed,
@@ -81,15 +46,26 @@ def build_json_summary(summary: TestRunSummary) -> dict[str, object]:
         "session_teardown_failures": [
             {
                 "fixture_name": failure.fixture_name,
-                "exception": _json_exception(failure.exc_type, failure.exc_value),
+                "exception": json_exception(failure.exc_type, failure.exc_value),
             }
             for failure in summary.session_teardown_failures
         ],
-        "tests": [_json_test_entry(result) for result in summary.test_results],
     }
 
 
-@dataclass
+def build_json_summary(summary: TestRunSummary) -> dict[str, object]:
+    return {
+        **_json_summary_counts(summary),
+        "tests": [json_test_entry(result) for result in summary.test_results],
+    }
+
+
+def build_json_stream_summary(summary: TestRunSummary) -> dict[str, object]:
+    """Closing `--json-stream` line: the run's counts, without per-test entries."""
+    return {"event": "summary", **_json_summary_counts(summary)}
+
+
+@dataclass(slots=True)
 class TestRunSummary:
     """Summary of test run results."""
 
@@ -106,19 +82,20 @@ class TestRunSummary:
 type CliAction = Literal["agent_docs", "help", "list_examples", "show_example"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CliOptions:
     action: CliAction | None = None
     capture_output: bool = True
     example_name: str | None = None
     filters: tuple[str, ...] = ()
     json_output: bool = False
+    json_stream: bool = False
     pdb_on_failure: bool = False
     mark: str | None = None
     timeout: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseError:
     """A CLI usage error, returned by the parser so the caller renders it once.
 
@@ -149,6 +126,7 @@ Options:
   --examples        List bundled examples
   --example NAME    Print a bundled example
   --json-output     Print machine-readable JSON summary
+  --json-stream     Print one JSON line per test as it finishes, then a summary line
   --mark MARK       Run tests marked fast, medium, or slow; marking tests is recommended
   --timeout SECONDS Fail any async test that runs longer than SECONDS (async-only)
   --pdb             Drop into post-mortem debugger on first failure
@@ -199,6 +177,10 @@ _ACTION_ARGS: dict[str, CliAction] = {
 }
 
 
+# Boolean flags that take no value; the parser only records which were seen.
+_SWITCH_ARGS = frozenset({"-s", "--json-output", "--json-stream", "--pdb"})
+
+
 def _parse_mark_flag(
     argv: list[str], index: int, current_mark: str | None
 ) -> tuple[str, int] | ParseError:
@@ -275,12 +257,10 @@ def parse_cli_args(argv: list[str]) -> CliOptions | ParseError:  # noqa: C901, P
     complexity metric would only re-spread parsing state across helpers.
     """
     action: CliAction | None = None
-    capture_output = True
     example_name: str | None = None
-    json_output = False
     mark: str | None = None
-    pdb_on_failure = False
     timeout: float | None = None
+    switches: set[str] = set()
     filters: list[str] = []
     duplicate_action = ParseError("Only one help/docs/examples command is supported")
 
@@ -298,12 +278,8 @@ def parse_cli_args(argv: list[str]) -> CliOptions | ParseError:  # noqa: C901, P
                 if isinstance(consumed, ParseError):
                     return consumed
                 example_name, index = consumed
-        elif arg == "-s":
-            capture_output = False
-        elif arg == "--json-output":
-            json_output = True
-        elif arg == "--pdb":
-            pdb_on_failure = True
+        elif arg in _SWITCH_ARGS:
+            switches.add(arg)
         elif arg == "--mark":
             parsed_mark = _parse_mark_flag(argv, index, mark)
             if isinstance(parsed_mark, ParseError):
@@ -320,6 +296,8 @@ def parse_cli_args(argv: list[str]) -> CliOptions | ParseError:  # noqa: C901, P
             filters.append(arg)
         index += 1
 
+    if {"--json-output", "--json-stream"} <= switches:
+        return ParseError("Use only one of --json-output and --json-stream")
     if action is not None and filters:
         return ParseError(
             "Cannot combine help/docs/examples commands with test filters"
@@ -329,17 +307,26 @@ def parse_cli_args(argv: list[str]) -> CliOptions | ParseError:  # noqa: C901, P
 
     return CliOptions(
         action=action,
-        capture_output=capture_output,
+        capture_output="-s" not in switches,
         example_name=example_name,
         filters=tuple(filters),
-        json_output=json_output,
+        json_output="--json-output" in switches,
+        json_stream="--json-stream" in switches,
         mark=mark,
-        pdb_on_failure=pdb_on_failure,
+        pdb_on_failure="--pdb" in switches,
         timeout=timeout,
     )
 
 
-async def _run_tests_with_producer_thread(  # noqa: PLR0913
+def _collection_failed(collector: asyncio.Task[None]) -> bool:
+    return (
+        collector.done()
+        and not collector.cancelled()
+        and collector.exception() is not None
+    )
+
+
+async def _run_tests_with_collector(  # noqa: PLR0913
     filter_items: list[FilterItem],
     *,
     capture_output: bool,
@@ -349,34 +336,27 @@ async def _run_tests_with_producer_thread(  # noqa: PLR0913
     reporter: RunReporter | None = None,
 ) -> tuple[list[TestResult], list[TeardownFailure]]:
     queue = TestsQueue()
-    collection_exception: list[BaseException] = []
-
-    producer_thread = threading.Thread(
-        target=load_tests_from_filters,
-        kwargs={
-            "filter_items": filter_items,
-            "queue": queue,
-            "loop": asyncio.get_running_loop(),
-            "mark": mark,
-            "exception_holder": collection_exception,
-        },
+    stop_collection = asyncio.Event()
+    collector = asyncio.create_task(
+        load_tests_from_filters(
+            filter_items, queue, mark=mark, stop_requested=stop_collection
+        )
     )
 
-    producer_thread.start()
-
     try:
         test_results, session_teardown_failures = await run_tests(
             queue=queue,
             capture_output=capture_output,
             pdb_on_failure=pdb_on_failure,
             timeout=timeout,
-            collection_failed=lambda: bool(collection_exception),
+            collection_failed=lambda: _collection_failed(collector),
             reporter=reporter,
         )
     finally:
-        producer_thread.join()
-        if collection_exception:
-            raise collection_exception[0]
+        # The run may end early (--pdb, cancellation); don't keep importing files.
+        stop_collection.set()
+        # Re-raises any CollectionError from the collector.
+        await collector
 
     return test_results, session_teardown_failures
 
@@ -416,7 +396,7 @@ async def run_tests_programmatic(  # noqa: PLR0913
     if mark is not None and not _is_valid_mark_value(mark):
         raise BadRequestError(_invalid_mark_message(mark))
 
-    test_results, session_teardown_failures = await _run_tests_with_producer_thread(
+    test_results, session_teardown_failures = await _run_tests_with_collector(
         filter_items,
         capture_output=capture_output,
         pdb_on_failure=pdb_on_failure,
@@ -425,14 +405,24 @@ async def run_tests_programmatic(  # noqa: PLR0913
         reporter=reporter or NullRunReporter(),
     )
 
+    passed = failed = errors = fixture_teardown_failed = 0
+    for r in test_results:
+        match r.result:
+            case PassedResult():
+                passed += 1
+            case FailedResult():
+                failed += 1
+            case ErrorResult():
+                errors += 1
+        if r.fixture_teardown_failures:
+            fixture_teardown_failed += 1
+
     return TestRunSummary(
         total_tests=len(test_results),
-        passed=sum(1 for r in test_results if isinstance(r.result, PassedResult)),
-        failed=sum(1 for r in test_results if isinstance(r.result, FailedResult)),
-        errors=sum(1 for r in test_results if isinstance(r.result, ErrorResult)),
-        fixture_teardown_failed=sum(
-            1 for r in test_results if r.fixture_teardown_failures
-        ),
+        passed=passed,
+        failed=failed,
+        errors=errors,
+        fixture_teardown_failed=fixture_teardown_failed,
         session_teardown_failed=len(session_teardown_failures),
         test_results=test_results,
         session_teardown_failures=session_teardown_failures,
@@ -442,7 +432,7 @@ async def run_tests_programmatic(  # noqa: PLR0913
 async def run_script(
     argv: list[str] | None = None,
     *,
-    run_tests_programmatic_fn: Callable[..., Coroutine[object, object, object]]
+    run_tests_programmatic_fn: Callable[..., Coroutine[object, object, TestRunSummary]]
     | None = None,
 ) -> int:
     """Parse arguments and run tests."""
@@ -463,32 +453,42 @@ async def run_script(
         return 2
 
     runner = run_tests_programmatic_fn or run_tests_programmatic
-    reporter = NullRunReporter() if options.json_output else ConsoleRunReporter()
+    reporter: RunReporter
+    if options.json_stream:
+        reporter = JsonStreamRunReporter()
+    elif options.json_output:
+        reporter = NullRunReporter()
+    else:
+        reporter = ConsoleRunReporter()
     try:
-        summary = cast(
-            "TestRunSummary",
-            await runner(
-                filter_items,
-                capture_output=options.capture_output,
-                pdb_on_failure=options.pdb_on_failure,
-                mark=options.mark,
-                timeout=options.timeout,
-                reporter=reporter,
-            ),
+        summary = await runner(
+            filter_items,
+            capture_output=options.capture_output,
+            pdb_on_failure=options.pdb_on_failure,
+            mark=options.mark,
+            timeout=options.timeout,
+            reporter=reporter,
         )
     except asyncio.CancelledError:
         return 2
 
     if options.json_output:
         print(json.dumps(build_json_summary(summary)))
+    elif options.json_stream:
+        print(json.dumps(build_json_stream_summary(summary)), flush=True)
 
     return exit_code_from_summary(summary)
 
 
 def main() -> None:
     """Main entry point for the CLI."""
-    async_runner = cast("Callable[[Coroutine[object, object, int]], int]", asyncio.run)
-    sys.exit(main_inner(async_runner=async_runner))
+    # Not `with`: entering would create the loop even when `run` is refused.
+    runner = asyncio.Runner()
+    try:
+        exit_code = main_inner(async_runner=runner.run)
+    finally:
+        runner.close()
+    sys.exit(exit_code)
 
 
 def main_inner(
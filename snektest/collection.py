@@ -1,19 +1,22 @@
 """Test discovery and collection into executable test cases."""
 
 import asyncio
-from collections.abc import Callable
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cache
 from importlib.machinery import ModuleSpec
 from importlib.util import module_from_spec, spec_from_file_location
-from inspect import getmembers, isfunction
 from pathlib import Path
 from sys import modules
-from typing import TypeGuard, cast
+from types import FunctionType, ModuleType
+from typing import Any, TypeGuard, cast
+from weakref import WeakKeyDictionary
 
-from pydantic import ValidationError
-
-from snektest.annotations import PyFilePath, validate_PyFilePath
-from snektest.models import CollectionError, FilterItem, TestCase, TestName
+from snektest.annotations import PyFilePath
+from snektest.models import CollectionError, FilterItem, Param, TestCase, TestName
 from snektest.utils import (
     get_test_function_markers,
     get_test_function_params,
@@ -22,7 +25,47 @@ from snektest.utils import (
 
 TEST_FILE_PREFIX = "test_"
 
-TestsQueue = asyncio.Queue[TestCase]
+
+class TestsQueue:
+    """Queue of collected tests between the collector task and `run_tests`.
+
+    Both sides run on the same event loop, so a deque plus one wake-up event is
+    enough: no locks, and no per-getter futures as in `asyncio.Queue`. Once
+    `shutdown` is called, `get` drains what is left and then raises
+    `asyncio.QueueShutDown`, matching `asyncio.Queue`.
+    """
+
+    def __init__(self) -> None:
+        self._items: deque[TestCase] = deque()
+        self._ready = asyncio.Event()
+        self._is_shutdown = False
+
+    def put_nowait(self, item: TestCase) -> None:
+        if self._is_shutdown:
+            raise asyncio.QueueShutDown
+        self._items.append(item)
+        self._ready.set()
+
+    def put_many(self, items: Iterable[TestCase]) -> None:
+        """Enqueue `items` in order with a single consumer wake-up."""
+        if self._is_shutdown:
+            raise asyncio.QueueShutDown
+        queued = len(self._items)
+        self._items.extend(items)
+        if len(self._items) > queued:
+            self._ready.set()
+
+    async def get(self) -> TestCase:
+        while not self._items:
+            if self._is_shutdown:
+                raise asyncio.QueueShutDown
+            self._ready.clear()
+            _ = await self._ready.wait()
+        return self._items.popleft()
+
+    def shutdown(self) -> None:
+        self._is_shutdown = True
+        self._ready.set()
 
 
 @dataclass(frozen=True)
@@ -33,34 +76,73 @@ class _CollectionMatchStats:
     params_matched: bool
 
 
-def load_tests_from_file(  # noqa: PLR0913
+@cache
+def _module_name_for(file_path: PyFilePath) -> str:
+    """Dotted `sys.modules` key for a test file, e.g. `tests.test_math`."""
+    return ".".join(file_path.with_suffix("").parts)
+
+
+def _load_module_from_file(
+    file_path: PyFilePath,
+    *,
+    spec_loader: Callable[..., object] = spec_from_file_location,
+) -> ModuleType:
+    """Import a test file once, reusing the module on later collections."""
+    module_name = _module_name_for(file_path)
+    if (module := modules.get(module_name)) is not None:
+        return module
+
+    spec = spec_loader(module_name, file_path)
+    spec_value = cast("ModuleSpec", spec)
+    loader = getattr(spec_value, "loader", None)
+    if loader is None:
+        msg = f"Could not load spec from {file_path}"
+        raise CollectionError(msg)
+
+    module = module_from_spec(spec_value)
+    modules[module_name] = module
+    loader.exec_module(module)
+    return module
+
+
+# Overlapping filters (`tests/` plus `tests/test_x.py::t`) revisit the same
+# module; scan its members once. Weak keys let unloaded modules drop out.
+_test_functions_by_module: WeakKeyDictionary[ModuleType, list[FunctionType]] = (
+    WeakKeyDictionary()
+)
+
+
+def _module_test_functions(module: ModuleType) -> list[FunctionType]:
+    """Return the `@test`-marked functions of a module, scanning it only once."""
+    cached = _test_functions_by_module.get(module)
+    if cached is None:
+        # `vars()` keeps definition order and skips `getmembers`' dir()+sort pass.
+        cached = [
+            value
+            for value in vars(module).values()
+            if type(value) is FunctionType and is_test_function(value)
+        ]
+        _test_functions_by_module[module] = cached
+    return cached
+
+
+async def load_tests_from_file(
     file_path: PyFilePath,
     filter_item: FilterItem,
     queue: TestsQueue,
-    loop: asyncio.AbstractEventLoop,
     *,
     mark: str | None = None,
     spec_loader: Callable[..., object] = spec_from_file_location,
 ) -> _CollectionMatchStats:
-    """Load and queue tests from a single Python file."""
-    module_name = ".".join(file_path.with_suffix("").parts)
-    if module_name in modules:
-        module = modules[module_name]
-    else:
-        spec = spec_loader(module_name, file_path)
-        spec_value = cast("ModuleSpec", spec)
-        loader = getattr(spec_value, "loader", None)
-        if loader is None:
-            msg = f"Could not load spec from {file_path}"
-            raise CollectionError(msg)
-
-        module = module_from_spec(spec_value)
-        modules[module_name] = module
-        loader.exec_module(module)
-
-    test_functions = [
-        func for _, func in getmembers(module, isfunction) if is_test_function(func)
-    ]
+    """Load and queue tests from a single Python file.
+
+    The import runs in a worker thread so a slow module doesn't stall tests
+    already running on the loop; queueing happens back on the loop thread.
+    """
+    module = await asyncio.to_thread(
+        _load_module_from_file, file_path, spec_loader=spec_loader
+    )
+    test_functions = _module_test_functions(module)
     if filter_item.function_name is None:
         named_functions = test_functions
     else:
@@ -74,28 +156,32 @@ def load_tests_from_file(  # noqa: PLR0913
         filter_item.params in get_test_function_params(func) for func in named_functions
     )
 
-    if mark is None:
-        runnable_functions = named_functions
-    else:
-        runnable_functions = [
-            func for func in named_functions if mark in get_test_function_markers(func)
-        ]
-
-    for func in runnable_functions:
+    collected: list[TestCase] = []
+    for func in named_functions:
         markers = get_test_function_markers(func)
-        for param_names, params in get_test_function_params(func).items():
-            if filter_item.params and filter_item.params != param_names:
-                continue
+        if mark is not None and mark not in markers:
+            continue
+        params_by_name = get_test_function_params(func)
+        selected: Iterable[tuple[str, tuple[Param[Any], ...]]]
+        if filter_item.params:
+            # A `[params]` selector names one case: look it up, don't scan them all.
+            params = params_by_name.get(filter_item.params)
+            selected = () if params is None else ((filter_item.params, params),)
+        else:
+            selected = params_by_name.items()
+        for param_names, params in selected:
             test_name = TestName(
                 file_path=file_path, func_name=func.__name__, params_part=param_names
             )
-            test_case = TestCase(
-                function=func,
-                markers=markers,
-                name=test_name,
-                param_values=tuple(param.value for param in params),
+            collected.append(
+                TestCase(
+                    function=func,
+                    markers=markers,
+                    name=test_name,
+                    param_values=tuple(param.value for param in params),
+                )
             )
-            _ = loop.call_soon_threadsafe(queue.put_nowait, test_case)
+    queue.put_many(collected)
 
     return _CollectionMatchStats(
         function_matched=filter_item.function_name is None or bool(named_functions),
@@ -103,57 +189,126 @@ def load_tests_from_file(  # noqa: PLR0913
     )
 
 
+def _is_pruned_dir(name: str) -> bool:
+    return name.startswith(".") or name == "__pycache__"
+
+
+def _scan_directory(directory: Path) -> tuple[list[PyFilePath], list[Path]]:
+    """Split one directory's entries into test files and subdirectories to walk.
+
+    Uses `os.scandir` directly: entries are rejected by name before any `Path`
+    is built, and the file check reuses the type scandir already read instead
+    of running each candidate through the pydantic validator. Hidden
+    directories (`.git`, `.venv`, ...) and `__pycache__` are not returned.
+    An unreadable directory contributes nothing.
+    """
+    files: list[PyFilePath] = []
+    subdirs: list[Path] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not _is_pruned_dir(entry.name):
+                        subdirs.append(directory / entry.name)
+                elif (
+                    entry.name.startswith(TEST_FILE_PREFIX)
+                    and entry.name.endswith(".py")
+                    and entry.is_file()
+                ):
+                    files.append(cast("PyFilePath", directory / entry.name))
+    except OSError:
+        return [], []
+    return files, subdirs
+
+
+def _iter_test_files(root: Path) -> Iterator[PyFilePath]:
+    """Yield runnable test files under `root`, in `Path.walk` order.
+
+    `root` itself is always walked, even if it is hidden.
+    """
+    stack = [root]
+    while stack:
+        files, subdirs = _scan_directory(stack.pop())
+        yield from files
+        stack.extend(reversed(subdirs))
+
+
+# Below this many top-level subdirectories, thread start-up costs more than the
+# overlapped `scandir` calls save.
+_PARALLEL_WALK_MIN_SUBDIRS = 4
+_PARALLEL_WALK_MAX_WORKERS = 8
+
+
+def _walk_test_files(root: Path) -> list[PyFilePath]:
+    """List runnable test files under `root`, in `_iter_test_files` order.
+
+    Wide trees walk each top-level subdirectory in its own thread: `scandir`
+    releases the GIL while it waits on the filesystem, so the subtrees' stat
+    latency overlaps. Results are joined in walk order, so the output is the
+    same as a sequential walk.
+    """
+    files, subdirs = _scan_directory(root)
+    if len(subdirs) < _PARALLEL_WALK_MIN_SUBDIRS:
+        files.extend(path for subdir in subdirs for path in _iter_test_files(subdir))
+        return files
+
+    def walk_subtree(subdir: Path) -> list[PyFilePath]:
+        return list(_iter_test_files(subdir))
+
+    workers = min(_PARALLEL_WALK_MAX_WORKERS, len(subdirs))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for subtree in pool.map(walk_subtree, subdirs):
+            files.extend(subtree)
+    return files
+
+
 def generate_file_list(filter_item: FilterItem) -> list[PyFilePath]:
     """Generate a list of valid file paths for given filter item."""
 
     def path_is_runnable(file_path: Path) -> TypeGuard[PyFilePath]:
-        if not file_path.name.startswith(TEST_FILE_PREFIX):
-            return False
-        try:
-            file_path = validate_PyFilePath(file_path)
-        except ValidationError:
-            return False
-        return True
+        # The same predicate `PyFilePath` validates, checked cheapest first.
+        return (
+            file_path.name.startswith(TEST_FILE_PREFIX)
+            and file_path.suffix == ".py"
+            and file_path.is_file()
+        )
 
     if filter_item.file_path.is_dir():
-        paths = [
-            dirpath / name
-            for dirpath, _, filenames in filter_item.file_path.walk()
-            for name in filenames
-        ]
-    else:
-        paths = [filter_item.file_path]
-
-    return [path for path in paths if path_is_runnable(path)]
+        return _walk_test_files(filter_item.file_path)
+    if path_is_runnable(filter_item.file_path):
+        return [filter_item.file_path]
+    return []
 
 
-def load_tests_from_filters(
+async def load_tests_from_filters(
     filter_items: list[FilterItem],
     queue: TestsQueue,
-    loop: asyncio.AbstractEventLoop,
     *,
     mark: str | None = None,
-    exception_holder: list[BaseException] | None = None,
+    stop_requested: asyncio.Event | None = None,
 ) -> None:
     """Load tests from all filter items and populate the queue.
 
+    Runs as a task on the same loop as the consumer. Any failure is raised as a
+    `CollectionError`; the queue is shut down either way.
+
     Args:
         filter_items: List of filter items to load tests from
         queue: Queue to populate with tests
-        loop: Event loop for thread-safe queue operations
-        exception_holder: Optional list to store exception if one occurs during collection
+        stop_requested: Optional event the consumer sets once it needs no more tests
     """
     try:
         for filter_item in filter_items:
-            file_paths = generate_file_list(filter_item)
+            file_paths = await asyncio.to_thread(generate_file_list, filter_item)
             function_matched = filter_item.function_name is None
             params_matched = filter_item.params is None
             for file_path in file_paths:
-                stats = load_tests_from_file(
+                if stop_requested is not None and stop_requested.is_set():
+                    return
+                stats = await load_tests_from_file(
                     file_path=file_path,
                     filter_item=filter_item,
                     queue=queue,
-                    loop=loop,
                     mark=mark,
                 )
                 function_matched = function_matched or stats.function_matched
@@ -170,13 +325,12 @@ def load_tests_from_filters(
                     f"filter `{filter_item}`"
                 )
                 raise CollectionError(msg)  # noqa: TRY301
+    except CollectionError, asyncio.CancelledError:
+        raise
     except BaseException as e:
-        if exception_holder is not None:
-            if isinstance(e, CollectionError):
-                exception_holder.append(e)
-            else:
-                collection_error = CollectionError(f"Error during collection: {e}")
-                collection_error.__cause__ = e
-                exception_holder.append(collection_error)
+        # Test modules can raise anything at import time, SystemExit included;
+        # report it as a collection failure rather than letting it escape the loop.
+        msg = f"Error during collection: {e}"
+        raise CollectionError(msg) from e
     finally:
-        _ = loop.call_soon_threadsafe(queue.shutdown)
+        queue.shutdown()
@@ -10,15 +10,11 @@ from inspect import (
 )
 from typing import Any, Literal, Protocol, TypeVar, cast, overload
 
-from hypothesis import given
-
 from snektest.annotations import AsyncFixture, Coroutine, Fixture, Scope
 from snektest.fixtures import current_registry
 from snektest.models import Param
 from snektest.utils import mark_test_function
 
-_given = cast("Any", given)
-
 T_co = TypeVar("T_co", covariant=True)
 
 
@@ -97,23 +93,33 @@ def _maybe_apply_hypothesis_settings(
     return settings_decorator(target)
 
 
+def _strategy_signature(strategy_count: int) -> Signature:
+    """Positional signature `given()` maps the strategies onto, one per strategy."""
+    return Signature(
+        parameters=[
+            Parameter(f"arg{i}", kind=Parameter.POSITIONAL_OR_KEYWORD)
+            for i in range(strategy_count)
+        ]
+    )
+
+
 def _run_hypothesis(
     wrapper: Callable[..., object],
     strategies: tuple[SearchStrategy[Any], ...],
     run_one_example: Callable[..., None],
+    *,
+    signature: Signature,
 ) -> None:
     def hypothesis_runner(*strategy_values: Any) -> None:
         run_one_example(*strategy_values)
 
-    signature = Signature(
-        parameters=[
-            Parameter(f"arg{i}", kind=Parameter.POSITIONAL_OR_KEYWORD)
-            for i in range(len(strategies))
-        ]
-    )
     hypothesis_runner.__signature__ = signature  # pyright: ignore[reportFunctionMemberAccess]
 
-    hypothesis_runner_wrapped = _given(*strategies)(hypothesis_runner)
+    # Imported on first use: hypothesis costs ~100ms to import, which suites
+    # without property tests shouldn't pay at startup.
+    from hypothesis import given  # noqa: PLC0415
+
+    hypothesis_runner_wrapped = cast("Any", given)(*strategies)(hypothesis_runner)
 
     runner = cast(
         "Callable[[], None]",
@@ -181,6 +187,7 @@ def test_hypothesis(
         raise ValueError(msg)
 
     strategies_tuple = tuple(strategies)
+    signature = _strategy_signature(len(strategies_tuple))
     markers = _normalize_markers(mark)
 
     def decorator(
@@ -201,7 +208,12 @@ def test_hypothesis(
                     )
 
                 def run_hypothesis() -> None:
-                    _run_hypothesis(async_wrapper, strategies_tuple, run_one_example)
+                    _run_hypothesis(
+                        async_wrapper,
+                        strategies_tuple,
+                        run_one_example,
+                        signature=signature,
+                    )
 
                 await asyncio.to_thread(run_hypothesis)
 
@@ -213,7 +225,9 @@ def test_hypothesis(
             def run_one_example(*strategy_values: Any) -> None:
                 _ = test_func(*strategy_values)
 
-            _run_hypothesis(sync_wrapper, strategies_tuple, run_one_example)
+            _run_hypothesis(
+                sync_wrapper, strategies_tuple, run_one_example, signature=signature
+            )
 
         mark_test_function(sync_wrapper, (), markers)
         return sync_wrapper
@@ -2,7 +2,6 @@
 
 import asyncio
 import pdb  # noqa: T100
-import sys
 import time
 from collections.abc import Callable, Coroutine
 from inspect import iscoroutine
@@ -21,7 +20,6 @@ from snektest.models import (
     TestCase,
     TestResult,
     TestTimeoutError,
-    UnreachableError,
 )
 from snektest.output import maybe_capture_output
 from snektest.reporting import ConsoleRunReporter, RunReporter
@@ -56,41 +54,29 @@ async def execute_test(
     *,
     capture_output: bool = True,
     timeout: float | None = None,  # noqa: ASYNC109
-    exc_info_provider: Callable[
-        [], tuple[object | None, object | None, TracebackType | None]
-    ] = sys.exc_info,
 ) -> TestResult:
     """Execute a collected test case with fixtures and output capture."""
     with maybe_capture_output(capture_output) as (output_buffer, captured_warnings):
-        test_start = time.monotonic()
+        test_start = time.perf_counter_ns()
         try:
             res = test_case.call()
             if iscoroutine(res):
                 await _await_test_body(res, timeout)
-            duration = time.monotonic() - test_start
             result = PassedResult()
-        except (AssertionFailure, asyncio.CancelledError):
-            duration = time.monotonic() - test_start
-            exc_type, exc_value, traceback = exc_info_provider()
-            if exc_type is None or exc_value is None or traceback is None:
-                msg = "Invalid exception info gathered. This shouldn't be possible!"
-                raise UnreachableError(msg) from None
+        except (AssertionFailure, asyncio.CancelledError) as e:
+            # A caught exception always carries the traceback it was raised with.
             result = FailedResult(
-                exc_type=cast("type[BaseException]", exc_type),
-                exc_value=cast("BaseException", exc_value),
-                traceback=traceback,
+                exc_type=type(e),
+                exc_value=e,
+                traceback=cast("TracebackType", e.__traceback__),
             )
-        except Exception:
-            duration = time.monotonic() - test_start
-            exc_type, exc_value, traceback = exc_info_provider()
-            if exc_type is None or exc_value is None or traceback is None:
-                msg = "Invalid exception info gathered. This shouldn't be possible!"
-                raise UnreachableError(msg) from None
+        except Exception as e:
             result = ErrorResult(
-                exc_type=cast("type[BaseException]", exc_type),
-                exc_value=cast("BaseException", exc_value),
-                traceback=traceback,
+                exc_type=type(e),
+                exc_value=e,
+                traceback=cast("TracebackType", e.__traceback__),
             )
+        duration = (time.perf_counter_ns() - test_start) / 1e9
 
     with maybe_capture_output(capture_output) as (
         fixture_teardown_buffer,
@@ -127,21 +113,12 @@ async def teardown_session_fixtures(
 
 def has_any_failures(
     test_results: list[TestResult], session_teardown_failures: list[TeardownFailure]
-) -> tuple[bool, bool, bool]:
-    """Check for test failures, fixture failures, and session failures."""
-    has_test_failures = any(
-        isinstance(result.result, (FailedResult, ErrorResult))
+) -> bool:
+    """Check for test, fixture teardown, or session teardown failures."""
+    return bool(session_teardown_failures) or any(
+        result.result.status != "passed" or result.fixture_teardown_failures
         for result in test_results
     )
-    has_fixture_teardown_failures = any(
-        result.fixture_teardown_failures for result in test_results
-    )
-    has_session_teardown_failures = len(session_teardown_failures) > 0
-    return (
-        has_test_failures,
-        has_fixture_teardown_failures,
-        has_session_teardown_failures,
-    )
 
 
 def _resolve_path(
@@ -193,10 +170,16 @@ def _traceback_for_file(
         return traceback
 
     selected: TracebackType | None = None
+    # Deep tracebacks revisit the same few files: resolve each one only once.
+    resolved_by_filename: dict[str, Path | None] = {}
     current = traceback
     while current is not None:
-        frame_path = Path(current.tb_frame.f_code.co_filename)
-        resolved = _resolve_path(frame_path, resolver=resolver)
+        filename = current.tb_frame.f_code.co_filename
+        if filename in resolved_by_filename:
+            resolved = resolved_by_filename[filename]
+        else:
+            resolved = _resolve_path(Path(filename), resolver=resolver)
+            resolved_by_filename[filename] = resolved
         if resolved == preferred:
             selected = current
         current = current.tb_next
@@ -260,7 +243,7 @@ async def run_tests(  # noqa: PLR0913
     if reporter is None:
         reporter = ConsoleRunReporter()
 
-    total_duration = time.monotonic()
+    run_start = time.perf_counter_ns()
     test_results: list[TestResult] = []
     session_teardown_failures: list[TeardownFailure] = []
     pdb_triggered = False
@@ -296,17 +279,9 @@ async def run_tests(  # noqa: PLR0913
                 ):
                     pdb_triggered = True
 
-                (
-                    has_test_failures,
-                    has_fixture_teardown_failures,
-                    has_session_teardown_failures,
-                ) = has_any_failures(test_results, session_teardown_failures)
-
                 session_output_for_display = None
-                if session_output and (
-                    has_test_failures
-                    or has_fixture_teardown_failures
-                    or has_session_teardown_failures
+                if session_output and has_any_failures(
+                    test_results, session_teardown_failures
                 ):
                     session_output_for_display = session_output
 
@@ -314,6 +289,6 @@ async def run_tests(  # noqa: PLR0913
                     test_results=test_results,
                     session_teardown_failures=session_teardown_failures,
                     session_teardown_output=session_output_for_display,
-                    total_duration=time.monotonic() - total_duration,
+                    total_duration=(time.perf_counter_ns() - run_start) / 1e9,
                 )
     return test_results, session_teardown_failures
@@ -1,7 +1,6 @@
 """Fixture registry: per-run ownership of caching, setup, and teardown."""
 
 import asyncio
-import sys
 from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
 from contextlib import contextmanager
 from contextvars import ContextVar
@@ -46,10 +45,6 @@ class _PendingAsyncSessionFixtureSetup:
 async def teardown_fixture(
     fixture_name: str,
     generator: object,
-    *,
-    exc_info_provider: Callable[
-        [], tuple[object | None, object | None, TracebackType | None]
-    ] = sys.exc_info,
 ) -> TeardownFailure | None:
     """Advance one fixture (sync or async) through teardown, capturing failure."""
     try:
@@ -59,16 +54,12 @@ async def teardown_fixture(
             next(generator)
     except StopAsyncIteration, StopIteration:
         return None
-    except Exception:
-        exc_type, exc_value, traceback = exc_info_provider()
-        if exc_type is None or exc_value is None or traceback is None:
-            msg = "Invalid exception info gathered during teardown. This shouldn't be possible!"
-            raise UnreachableError(msg) from None
+    except Exception as e:
         return TeardownFailure(
             fixture_name=fixture_name,
-            exc_type=cast("type[BaseException]", exc_type),
-            exc_value=cast("BaseException", exc_value),
-            traceback=traceback,
+            exc_type=type(e),
+            exc_value=e,
+            traceback=cast("TracebackType", e.__traceback__),
         )
     else:
         msg = f"Incorrect fixture function {fixture_name} yielded more than once"
@@ -196,11 +187,12 @@ class FixtureRegistry:
     async def teardown_function_fixtures(self) -> list[TeardownFailure]:
         """Tear down active function fixtures in first-in-last-out order."""
         failures: list[TeardownFailure] = []
-        for fixture_name, generator in reversed(self._function_stack):
+        stack = self._function_stack
+        while stack:
+            fixture_name, generator = stack.pop()
             failure = await teardown_fixture(fixture_name, generator)
             if failure is not None:
                 failures.append(failure)
-        self._function_stack.clear()
         return failures
 
     async def teardown_session_fixtures(self) -> list[TeardownFailure]:
@@ -219,11 +211,11 @@ _current_registry: ContextVar[FixtureRegistry] = ContextVar("snektest_fixture_re
 
 def current_registry() -> FixtureRegistry:
     """Return the fixture registry for the current run."""
-    try:
-        return _current_registry.get()
-    except LookupError:
+    registry = _current_registry.get(None)
+    if registry is None:
         msg = "No active fixture registry. `load_fixture` must be called during a snektest run."
-        raise UnreachableError(msg) from None
+        raise UnreachableError(msg)
+    return registry
 
 
 @contextmanager
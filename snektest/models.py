@@ -7,7 +7,7 @@ from io import StringIO
 from itertools import product
 from pathlib import Path
 from types import TracebackType
-from typing import Any
+from typing import Any, ClassVar, Literal
 
 from snektest.annotations import Coroutine
 
@@ -122,7 +122,7 @@ class FilterItem:
 
 
 # Set kw_only so we can write attributes in the order they appear
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TestName:
     file_path: Path
     func_name: str
@@ -136,13 +136,19 @@ class TestName:
         return result
 
 
-class PassedResult: ...
+type ResultStatus = Literal["passed", "failed", "error"]
+"""Outcome tag carried by each result class, so callers needn't type-dispatch."""
+
+
+class PassedResult:
+    __slots__ = ()
+    status: ClassVar[ResultStatus] = "passed"
 
 
 type TestFunction = Callable[..., Coroutine[None] | None]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TestCase:
     """Collected test case with decorator metadata resolved once.
 
@@ -189,21 +195,25 @@ class Scope(Enum):
     SESSION = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FailedResult:
+    status: ClassVar[ResultStatus] = "failed"
+
     exc_type: type[BaseException]
     exc_value: BaseException
     traceback: TracebackType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ErrorResult:
+    status: ClassVar[ResultStatus] = "error"
+
     exc_type: type[BaseException]
     exc_value: BaseException
     traceback: TracebackType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TeardownFailure:
     """Represents a fixture teardown failure"""
 
@@ -213,7 +223,7 @@ class TeardownFailure:
     traceback: TracebackType
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     name: TestName
     duration: float
@@ -1,17 +1,18 @@
 from rich.console import Console
 
-from snektest.models import (
-    ErrorResult,
-    FailedResult,
-    PassedResult,
-    TeardownFailure,
-    TestResult,
-)
+from snektest.models import ResultStatus, TeardownFailure, TestResult
 from snektest.presenter.errors import print_failures as _print_failures
 from snektest.presenter.summary import print_summary as _print_summary
 
 console = Console()
 
+# Label and style of the per-test progress line, keyed by result status.
+_STATUS_DISPLAY: dict[ResultStatus, tuple[str, str]] = {
+    "passed": ("OK", "green"),
+    "failed": ("FAIL", "red"),
+    "error": ("ERROR", "dark_orange"),
+}
+
 
 def print_error(exc: str) -> None:
     """Print an error message in red."""
@@ -26,31 +27,14 @@ def print_test_result_to_console(console: Console, result: TestResult) -> None:
         highlight=False,
         soft_wrap=True,
     )
-    match result.result:
-        case PassedResult():
-            console.print(
-                f"OK ({result.duration:.2f}s)",
-                highlight=False,
-                style="green",
-                markup=False,
-                soft_wrap=True,
-            )
-        case FailedResult():
-            console.print(
-                f"FAIL ({result.duration:.2f}s)",
-                highlight=False,
-                style="red",
-                markup=False,
-                soft_wrap=True,
-            )
-        case ErrorResult():
-            console.print(
-                f"ERROR ({result.duration:.2f}s)",
-                highlight=False,
-                style="dark_orange",
-                markup=False,
-                soft_wrap=True,
-            )
+    label, style = _STATUS_DISPLAY[result.result.status]
+    console.print(
+        f"{label} ({result.duration:.2f}s)",
+        highlight=False,
+        style=style,
+        markup=False,
+        soft_wrap=True,
+    )
 
 
 def print_test_result(result: TestResult) -> None:
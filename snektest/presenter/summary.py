@@ -184,16 +184,16 @@ def print_summary(
     if session_teardown_failures is None:
         session_teardown_failures = []
 
-    passed = sum(
-        1 for result in test_results if isinstance(result.result, PassedResult)
-    )
-    failed = sum(
-        1 for result in test_results if isinstance(result.result, FailedResult)
-    )
-    errors = sum(1 for result in test_results if isinstance(result.result, ErrorResult))
-    fixture_teardown_failed = sum(
-        len(result.fixture_teardown_failures) for result in test_results
-    )
+    passed = failed = errors = fixture_teardown_failed = 0
+    for result in test_results:
+        match result.result:
+            case PassedResult():
+                passed += 1
+            case FailedResult():
+                failed += 1
+            case ErrorResult():
+                errors += 1
+        fixture_teardown_failed += len(result.fixture_teardown_failures)
     session_teardown_failed = len(session_teardown_failures)
 
     counts = RunCounts(
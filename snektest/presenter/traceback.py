@@ -7,6 +7,9 @@ from rich.syntax import Syntax
 
 import snektest
 
+# Frames from snektest itself are hidden; computed once rather than per render.
+_SNEKTEST_PATH = str(snektest.__file__).rsplit("/", 1)[0]
+
 
 def render_traceback(  # noqa: PLR0913
     console: Console,
@@ -21,7 +24,8 @@ def render_traceback(  # noqa: PLR0913
     console.print("[bold]Traceback[/bold] [dim](most recent call last):[/dim]")
 
     tb = traceback
-    snektest_path = str(snektest.__file__).rsplit("/", 1)[0]
+    # Frames often repeat a file (recursion, helpers); read each one once.
+    source_cache: dict[str, list[str]] = {}
 
     while tb:
         if not isinstance(tb, TracebackType):
@@ -32,17 +36,20 @@ def render_traceback(  # noqa: PLR0913
         filename = frame.f_code.co_filename
         name = frame.f_code.co_name
 
-        if not filename.startswith(snektest_path):
+        if not filename.startswith(_SNEKTEST_PATH):
             console.print(
                 f'  File "[cyan]{filename}[/cyan]", line {lineno}, in [yellow]{name}[/yellow]'
             )
 
             try:
-                if open_path is None:
-                    with pathlib.Path(filename).open(encoding="utf-8") as f:
-                        lines = f.readlines()
-                else:
-                    lines = open_path(filename)
+                lines = source_cache.get(filename)
+                if lines is None:
+                    if open_path is None:
+                        with pathlib.Path(filename).open(encoding="utf-8") as f:
+                            lines = f.readlines()
+                    else:
+                        lines = open_path(filename)
+                    source_cache[filename] = lines
                 if 0 <= lineno - 1 < len(lines):
                     code_line = lines[lineno - 1].rstrip()
                     syntax = Syntax(
@@ -1,11 +1,50 @@
 """Adapters for reporting test run progress and completion."""
 
+import json
 from typing import Protocol
 
-from snektest.models import TeardownFailure, TestResult
+from snektest.models import (
+    ErrorResult,
+    FailedResult,
+    PassedResult,
+    TeardownFailure,
+    TestResult,
+)
 from snektest.presenter import print_failures, print_summary, print_test_result
 
 
+def json_exception(
+    exc_type: type[BaseException], exc_value: BaseException
+) -> dict[str, str]:
+    return {"type": exc_type.__name__, "message": str(exc_value)}
+
+
+def json_test_entry(result: TestResult) -> dict[str, object]:
+    """Describe one test result in the `--json-output`/`--json-stream` shape."""
+    entry: dict[str, object] = {
+        "name": str(result.name),
+        "duration": result.duration,
+        "markers": list(result.markers),
+        "status": result.result.status,
+    }
+    match result.result:
+        case FailedResult(exc_type=exc_type, exc_value=exc_value):
+            entry["exception"] = json_exception(exc_type, exc_value)
+        case ErrorResult(exc_type=exc_type, exc_value=exc_value):
+            entry["exception"] = json_exception(exc_type, exc_value)
+        case PassedResult():
+            pass
+    if result.fixture_teardown_failures:
+        entry["fixture_teardown_failures"] = [
+            {
+                "fixture_name": failure.fixture_name,
+                "exception": json_exception(failure.exc_type, failure.exc_value),
+            }
+            for failure in result.fixture_teardown_failures
+        ]
+    return entry
+
+
 class RunReporter(Protocol):
     """Interface for observing test execution without owning execution.
 
@@ -76,8 +115,39 @@ class NullRunReporter:
         )
 
 
+class JsonStreamRunReporter:
+    """Reporter adapter that writes one JSON line per test as it finishes.
+
+    Results reach the consumer while the run is still going, and nothing is
+    accumulated for output. The caller writes the closing summary line, since
+    it owns the run's counts.
+    """
+
+    def test_finished(self, test_result: TestResult) -> None:
+        line = json.dumps({"event": "test", **json_test_entry(test_result)})
+        print(line, flush=True)
+
+    def run_finished(
+        self,
+        *,
+        test_results: list[TestResult],
+        session_teardown_failures: list[TeardownFailure],
+        session_teardown_output: str | None,
+        total_duration: float,
+    ) -> None:
+        _ = (
+            test_results,
+            session_teardown_failures,
+            session_teardown_output,
+            total_duration,
+        )
+
+
 __all__ = [
     "ConsoleRunReporter",
+    "JsonStreamRunReporter",
     "NullRunReporter",
     "RunReporter",
+    "json_exception",
+    "json_test_entry",
 ]
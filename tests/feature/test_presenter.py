@@ -332,3 +332,33 @@ def test_render_traceback_handles_oserror_open() -> None:
     render_traceback(console, RuntimeError, RuntimeError("x"), tb)
     render_traceback(console, RuntimeError, RuntimeError("x"), tb)
     render_traceback(console, RuntimeError, RuntimeError("x"), tb)
+
+
+def _raise_from_helper() -> None:
+    msg = "nested"
+    raise RuntimeError(msg)
+
+
+def _traceback_through_helper() -> TracebackType:
+    try:
+        _raise_from_helper()
+    except RuntimeError as e:
+        return assert_is_not_none(e.__traceback__)
+    msg = "helper did not raise"
+    raise AssertionError(msg)
+
+
+@test()
+def test_render_traceback_reads_each_source_file_once() -> None:
+    console = Console(record=True)
+    tb = _traceback_through_helper()
+    opened: list[str] = []
+
+    def open_path(path: str) -> list[str]:
+        opened.append(path)
+        return Path(path).read_text(encoding="utf-8").splitlines()
+
+    render_traceback(console, RuntimeError, RuntimeError("x"), tb, open_path=open_path)
+
+    assert_eq(opened, [__file__])
+    assert_in("raise RuntimeError(msg)", console.export_text())
@@ -16,12 +16,14 @@ from snektest import (
     assert_in,
     assert_is_none,
     assert_isinstance,
+    assert_not_in,
     assert_raises,
     test,
 )
 from snektest.cli import (
     CliOptions,
     ParseError,
+    TestRunSummary,
     main,
     main_inner,
     parse_cli_args,
@@ -55,6 +57,7 @@ def test_parse_cli_args_defaults_to_dot() -> None:
     assert_eq(options.action, None)
     assert_eq(options.capture_output, True)
     assert_eq(options.json_output, False)
+    assert_eq(options.json_stream, False)
     assert_eq(options.pdb_on_failure, False)
     assert_eq(options.mark, None)
 
@@ -206,7 +209,7 @@ async def test_run_script_rejects_unknown_example() -> None:
 
 @test()
 async def test_run_script_returns_2_on_cancelled_error() -> None:
-    async def raise_cancelled(*args: object, **kwargs: object) -> object:
+    async def raise_cancelled(*args: object, **kwargs: object) -> TestRunSummary:
         _ = (args, kwargs)
         raise asyncio.CancelledError
 
@@ -262,6 +265,44 @@ def test_one() -> None:
     assert_eq(json.loads(buffer.getvalue())["passed"], 1)
 
 
+@test()
+def test_parse_cli_args_rejects_both_json_modes() -> None:
+    result = parse_cli_args(["--json-output", "--json-stream"])
+    result = assert_isinstance(result, ParseError)
+    assert_in("--json-stream", result.message)
+
+
+@test()
+async def test_run_script_json_stream_prints_one_line_per_test() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        test_file = Path(tmp) / "test_json_stream.py"
+        _ = test_file.write_text(
+            """
+from snektest import assert_eq, test
+
+@test()
+def test_one() -> None:
+    pass
+
+@test()
+def test_two() -> None:
+    assert_eq(1, 2, msg="boom")
+""".lstrip()
+        )
+
+        buffer = StringIO()
+        with contextlib.redirect_stdout(buffer):
+            result = await run_script(["--json-stream", str(test_file)])
+
+    assert_eq(result, 1)
+    lines = [json.loads(line) for line in buffer.getvalue().splitlines()]
+    assert_eq([line["event"] for line in lines], ["test", "test", "summary"])
+    assert_eq([line.get("status") for line in lines[:2]], ["passed", "failed"])
+    assert_eq(lines[1]["exception"]["message"], "boom")
+    assert_eq((lines[2]["passed"], lines[2]["failed"]), (1, 1))
+    assert_not_in("tests", lines[2])
+
+
 @test()
 async def test_run_tests_programmatic_does_not_print() -> None:
     with tempfile.TemporaryDirectory() as tmp:
@@ -286,7 +327,7 @@ def test_one() -> None:
 
 @test()
 async def test_run_script_json_output_includes_markers() -> None:
-    async def fake_run(*args: object, **kwargs: object) -> object:
+    async def fake_run(*args: object, **kwargs: object) -> TestRunSummary:
         _ = (args, kwargs)
         test_result = TestResult(
             name=TestName(
@@ -300,19 +341,16 @@ async def test_run_script_json_output_includes_markers() -> None:
             fixture_teardown_output=None,
             warnings=[],
         )
-        return type(
-            "Summary",
-            (),
-            {
-                "passed": 1,
-                "failed": 0,
-                "errors": 0,
-                "fixture_teardown_failed": 0,
-                "session_teardown_failed": 0,
-                "session_teardown_failures": [],
-                "test_results": [test_result],
-            },
-        )()
+        return TestRunSummary(
+            total_tests=1,
+            passed=1,
+            failed=0,
+            errors=0,
+            fixture_teardown_failed=0,
+            session_teardown_failed=0,
+            test_results=[test_result],
+            session_teardown_failures=[],
+        )
 
     buffer = StringIO()
     with contextlib.redirect_stdout(buffer):
@@ -28,6 +28,7 @@ _KNOWN_TOKENS = [
     "example",
     "-s",
     "--json-output",
+    "--json-stream",
     "--pdb",
     "--mark",
     "--timeout",
@@ -76,6 +77,7 @@ def test_successful_parse_satisfies_invariants(argv: list[str]) -> None:
         assert_true(len(result.filters) >= 1)
 
     assert_true(result.mark is None or result.mark in VALID_MARKER_VALUES)
+    assert_true(not (result.json_output and result.json_stream))
     assert_true(result.timeout is None or result.timeout > 0)
 
 
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import tempfile
 from pathlib import Path
 from typing import cast
 
 from pydantic import TypeAdapter
 
-from snektest import assert_eq, assert_raises, test
+from snektest import assert_eq, assert_is, assert_isinstance, assert_raises, test
 from snektest.annotations import PyFilePath
-from snektest.collection import TestsQueue, load_tests_from_file
-from snektest.models import CollectionError, FilterItem
+from snektest.collection import (
+    TestsQueue,
+    generate_file_list,
+    load_tests_from_file,
+    load_tests_from_filters,
+)
+from snektest.models import CollectionError, FilterItem, TestCase, TestName
+
+
+def _noop_case(func_name: str) -> TestCase:
+    return TestCase(
+        function=lambda: None,
+        markers=(),
+        name=TestName(file_path=Path(__file__), func_name=func_name, params_part=""),
+    )
 
 
 @test()
@@ -32,14 +46,13 @@ def test_one() -> None:
             "PyFilePath", TypeAdapter(PyFilePath).validate_python(test_file)
         )
         filter_item = FilterItem(str(test_file))
-        loop = asyncio.get_running_loop()
 
         queue: TestsQueue = TestsQueue()
-        _ = load_tests_from_file(file_path, filter_item, queue, loop, mark=None)
+        _ = await load_tests_from_file(file_path, filter_item, queue, mark=None)
         _ = await asyncio.wait_for(queue.get(), timeout=1)
 
         queue2: TestsQueue = TestsQueue()
-        _ = load_tests_from_file(file_path, filter_item, queue2, loop, mark=None)
+        _ = await load_tests_from_file(file_path, filter_item, queue2, mark=None)
         _ = await asyncio.wait_for(queue2.get(), timeout=1)
 
 
@@ -67,25 +80,22 @@ def test_other() -> None:
         file_path = cast(
             "PyFilePath", TypeAdapter(PyFilePath).validate_python(test_file)
         )
-        loop = asyncio.get_running_loop()
 
         queue: TestsQueue = TestsQueue()
-        _ = load_tests_from_file(
+        _ = await load_tests_from_file(
             file_path,
             FilterItem(f"{test_file}::test_other"),
             queue,
-            loop,
             mark=None,
         )
         test_case = await asyncio.wait_for(queue.get(), timeout=1)
         assert_eq(test_case.name.func_name, "test_other")
 
         queue2: TestsQueue = TestsQueue()
-        _ = load_tests_from_file(
+        _ = await load_tests_from_file(
             file_path,
             FilterItem(f"{test_file}::test_param[one]"),
             queue2,
-            loop,
             mark=None,
         )
         parametrized_case = await asyncio.wait_for(queue2.get(), timeout=1)
@@ -93,11 +103,10 @@ def test_other() -> None:
         assert_eq(parametrized_case.param_values, (1,))
 
         queue2 = TestsQueue()
-        _ = load_tests_from_file(
+        _ = await load_tests_from_file(
             file_path,
             FilterItem(f"{test_file}::test_param[does not match]"),
             queue2,
-            loop,
             mark=None,
         )
         queue2.shutdown()
@@ -106,24 +115,207 @@ def test_other() -> None:
 
 
 @test()
-def test_load_tests_from_file_spec_loader_failure_raises_collection_error() -> None:
+async def test_load_tests_from_file_spec_loader_failure_raises_collection_error() -> (
+    None
+):
     def fake_spec(_name: object, _path: object) -> None:
         return None
 
     with assert_raises(CollectionError):
         queue: TestsQueue = TestsQueue()
-        loop = asyncio.new_event_loop()
-        try:
-            _ = load_tests_from_file(
-                cast(
-                    "PyFilePath",
-                    TypeAdapter(PyFilePath).validate_python(Path(__file__)),
-                ),
-                FilterItem(str(Path(__file__))),
-                queue,
-                loop,
-                mark=None,
-                spec_loader=fake_spec,
-            )
-        finally:
-            loop.close()
+        _ = await load_tests_from_file(
+            cast(
+                "PyFilePath",
+                TypeAdapter(PyFilePath).validate_python(Path(__file__)),
+            ),
+            FilterItem(str(Path(__file__))),
+            queue,
+            mark=None,
+            spec_loader=fake_spec,
+        )
+
+
+@test()
+def test_generate_file_list_lists_parent_files_before_subdirectories() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "sub").mkdir()
+        (root / "test_dir.py").mkdir()
+        for relative in (
+            "test_top.py",
+            "helper.py",
+            "test_notes.txt",
+            "sub/test_nested.py",
+        ):
+            _ = (root / relative).write_text("")
+
+        paths = generate_file_list(FilterItem(str(root)))
+
+        assert_eq(paths, [root / "test_top.py", root / "sub" / "test_nested.py"])
+
+
+@test()
+def test_generate_file_list_skips_hidden_and_pycache_directories() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / ".hidden_root"
+        for relative in (
+            "test_top.py",
+            ".venv/test_vendored.py",
+            "__pycache__/test_cached.py",
+            "sub/.git/test_object.py",
+        ):
+            (root / relative).parent.mkdir(parents=True, exist_ok=True)
+            _ = (root / relative).write_text("")
+
+        paths = generate_file_list(FilterItem(str(root)))
+
+        assert_eq(paths, [root / "test_top.py"])
+
+
+def _make_unscannable_dir(parent: Path) -> None:
+    """Nest directories past PATH_MAX so `os.scandir` on the deepest one fails.
+
+    Built with `dir_fd`-relative calls, since the full path is too long to use.
+    """
+    fd = os.open(parent, os.O_RDONLY)
+    try:
+        for _ in range(20):
+            name = "d" * 250
+            os.mkdir(name, dir_fd=fd)
+            next_fd = os.open(name, os.O_RDONLY, dir_fd=fd)
+            os.close(fd)
+            fd = next_fd
+        os.close(os.open("test_unreachable.py", os.O_CREAT | os.O_WRONLY, dir_fd=fd))
+    finally:
+        os.close(fd)
+
+
+@test()
+def test_generate_file_list_skips_directories_it_cannot_scan() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _ = (root / "test_top.py").write_text("")
+        (root / "kept").mkdir()
+        _ = (root / "kept" / "test_kept.py").write_text("")
+        _make_unscannable_dir(root)
+
+        paths = generate_file_list(FilterItem(str(root)))
+
+        assert_eq(sorted(paths), [root / "kept" / "test_kept.py", root / "test_top.py"])
+
+
+@test()
+def test_generate_file_list_wide_tree_matches_sequential_walk_order() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _ = (root / "test_top.py").write_text("")
+        for index in range(6):
+            nested = root / f"pkg{index}" / "inner"
+            nested.mkdir(parents=True)
+            _ = (root / f"pkg{index}" / f"test_pkg{index}.py").write_text("")
+            _ = (nested / f"test_inner{index}.py").write_text("")
+
+        expected = [
+            Path(directory) / name
+            for directory, _, names in os.walk(root)
+            for name in names
+        ]
+        paths = generate_file_list(FilterItem(str(root)))
+
+        assert_eq(len(paths), 13)
+        assert_eq(paths, expected)
+
+
+@test()
+async def test_load_tests_from_filters_stops_before_next_file_when_requested() -> None:
+    queue: TestsQueue = TestsQueue()
+    stop_requested = asyncio.Event()
+    stop_requested.set()
+
+    await load_tests_from_filters(
+        [FilterItem(f"{__file__}::test_missing")],
+        queue,
+        stop_requested=stop_requested,
+    )
+
+    with assert_raises(asyncio.QueueShutDown):
+        _ = await asyncio.wait_for(queue.get(), timeout=1)
+
+
+@test()
+async def test_load_tests_from_filters_wraps_import_errors() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        test_file = Path(tmp) / "test_collection_import_error.py"
+        _ = test_file.write_text("raise SystemExit(3)\n")
+        queue: TestsQueue = TestsQueue()
+
+        with assert_raises(CollectionError) as raised:
+            await load_tests_from_filters([FilterItem(str(test_file))], queue)
+
+        _ = assert_isinstance(raised.exception.__cause__, SystemExit)
+        with assert_raises(asyncio.QueueShutDown):
+            _ = await asyncio.wait_for(queue.get(), timeout=1)
+
+
+@test()
+async def test_tests_queue_drains_items_before_reporting_shutdown() -> None:
+    queue = TestsQueue()
+    first = _noop_case("first")
+    waiter = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+
+    queue.put_nowait(first)
+    queue.put_nowait(first)
+    queue.shutdown()
+
+    assert_is(await waiter, first)
+    assert_is(await queue.get(), first)
+    with assert_raises(asyncio.QueueShutDown):
+        _ = await queue.get()
+    with assert_raises(asyncio.QueueShutDown):
+        queue.put_nowait(first)
+
+
+@test()
+async def test_tests_queue_put_many_keeps_order_and_respects_shutdown() -> None:
+    queue = TestsQueue()
+    cases = [_noop_case(name) for name in ("a", "b", "c")]
+
+    queue.put_many([])
+    queue.put_many(cases)
+
+    assert_eq([await queue.get() for _ in cases], cases)
+    queue.shutdown()
+    with assert_raises(asyncio.QueueShutDown):
+        queue.put_many(cases)
+
+
+@test()
+async def test_load_tests_from_file_keeps_definition_order() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        test_file = Path(tmp) / "test_collection_definition_order.py"
+        _ = test_file.write_text(
+            """
+from snektest import test
+
+@test()
+def test_zebra() -> None:
+    pass
+
+@test()
+def test_apple() -> None:
+    pass
+""".lstrip()
+        )
+        file_path = cast(
+            "PyFilePath", TypeAdapter(PyFilePath).validate_python(test_file)
+        )
+        queue = TestsQueue()
+
+        _ = await load_tests_from_file(file_path, FilterItem(str(test_file)), queue)
+        queue.shutdown()
+
+        names = [(await queue.get()).name.func_name for _ in range(2)]
+        assert_eq(names, ["test_zebra", "test_apple"])
+        with assert_raises(asyncio.QueueShutDown):
+            _ = await queue.get()
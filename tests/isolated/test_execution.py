@@ -16,6 +16,7 @@ from snektest import (
     load_fixture,
     test,
 )
+from snektest.collection import TestsQueue
 from snektest.execution import execute_test, run_tests
 from snektest.fixtures import FixtureRegistry, teardown_fixture, use_registry
 from snektest.models import (
@@ -27,7 +28,6 @@ from snektest.models import (
     TestFunction,
     TestName,
     TestTimeoutError,
-    UnreachableError,
 )
 
 
@@ -60,7 +60,7 @@ async def _run_queue(
     post_mortem: Callable[[TracebackType], None] | None = None,
     resolver: Callable[[Path], Path] | None = None,
 ) -> None:
-    queue: asyncio.Queue[TestCase] = asyncio.Queue()
+    queue = TestsQueue()
     for entry in entries:
         queue.put_nowait(entry)
 
@@ -98,42 +98,6 @@ async def test_teardown_fixture_raises_on_multiple_yields() -> None:
         _ = await teardown_fixture("fixture", gen)
 
 
-@test()
-async def test_sys_exc_info_defensive_branches_raise_unreachable() -> None:
-    def teardown_raises() -> Generator[int]:
-        yield 1
-        msg = "boom"
-        raise RuntimeError(msg)
-
-    gen = teardown_raises()
-    _ = next(gen)
-
-    def missing_exc_info() -> tuple[object | None, object | None, TracebackType | None]:
-        return None, None, None
-
-    with assert_raises(UnreachableError):
-        _ = await teardown_fixture("x", gen, exc_info_provider=missing_exc_info)
-
-    name = TestName(file_path=Path("x.py"), func_name="t", params_part="")
-
-    def fail_assertion() -> None:
-        fail("boom")
-
-    with assert_raises(UnreachableError):
-        _ = await execute_test(
-            _test_case(name, fail_assertion), exc_info_provider=missing_exc_info
-        )
-
-    def raise_error() -> None:
-        msg = "boom"
-        raise RuntimeError(msg)
-
-    with assert_raises(UnreachableError):
-        _ = await execute_test(
-            _test_case(name, raise_error), exc_info_provider=missing_exc_info
-        )
-
-
 @test()
 async def test_debug_paths_cover_resolve_and_selected_none() -> None:
     def failing() -> None:
@@ -158,6 +122,38 @@ async def test_debug_paths_cover_resolve_and_selected_none() -> None:
     )
 
 
+@test()
+async def test_debug_resolves_each_traceback_file_once() -> None:
+    def recurse(depth: int) -> None:
+        if depth == 0:
+            fail("boom")
+        recurse(depth - 1)
+
+    def failing() -> None:
+        recurse(5)
+
+    name = TestName(file_path=Path(__file__), func_name="t", params_part="")
+    resolved: list[Path] = []
+
+    def recording_resolver(path: Path) -> Path:
+        resolved.append(path)
+        return path.resolve()
+
+    def debug_noop_post_mortem(_: TracebackType) -> None:
+        return None
+
+    await _run_queue(
+        [_test_case(name, failing)],
+        pdb_on_failure=True,
+        post_mortem=debug_noop_post_mortem,
+        resolver=recording_resolver,
+    )
+
+    frame_paths = resolved[1:]
+    assert_eq(frame_paths.count(Path(__file__)), 1)
+    assert_eq(len(frame_paths), len(set(frame_paths)))
+
+
 @test()
 async def test_debug_fixture_teardown_branch() -> None:
     @fixture
@@ -248,7 +244,7 @@ async def test_run_tests_continues_after_cancelled_test() -> None:
     def passing() -> None:
         return None
 
-    queue: asyncio.Queue[TestCase] = asyncio.Queue()
+    queue = TestsQueue()
     queue.put_nowait(
         _test_case(
             TestName(file_path=Path("x.py"), func_name="cancelled", params_part=""),
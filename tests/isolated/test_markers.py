@@ -97,14 +97,12 @@ def test_unmarked() -> None:
             "PyFilePath", TypeAdapter(PyFilePath).validate_python(test_file)
         )
         filter_item = FilterItem(str(test_file))
-        loop = asyncio.get_running_loop()
 
         queue: TestsQueue = TestsQueue()
-        _ = load_tests_from_file(
+        _ = await load_tests_from_file(
             file_path,
             filter_item,
             queue,
-            loop,
             mark="fast",
         )
         test_case = await asyncio.wait_for(queue.get(), timeout=1)
@@ -113,11 +111,10 @@ def test_unmarked() -> None:
         queue.shutdown()
 
         queue_empty: TestsQueue = TestsQueue()
-        _ = load_tests_from_file(
+        _ = await load_tests_from_file(
             file_path,
             filter_item,
             queue_empty,
-            loop,
             mark="medium",
         )
         queue_empty.shutdown()
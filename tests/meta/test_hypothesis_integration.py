@@ -1,5 +1,7 @@
 """Meta tests for running Hypothesis-based tests via snektest."""
 
+import subprocess
+import sys
 from textwrap import dedent
 
 from snektest import load_fixture, test
@@ -134,3 +136,18 @@ async def test_hypothesis_marked_test_filters_with_cli_mark() -> None:
     assert_eq(payload["tests"][0]["name"], f"{test_file}::test_fast")
     assert_eq(payload["tests"][0]["markers"], ["fast"])
     assert_eq(payload["returncode"], 0)
+
+
+@test()
+def test_importing_snektest_does_not_import_hypothesis() -> None:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, snektest, snektest.cli; print('hypothesis' in sys.modules)",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert_eq(result.stdout.strip(), "False")